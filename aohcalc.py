@@ -7,20 +7,16 @@ import pyshark # pylint: disable=W0611
 import numpy as np
 import pandas as pd
 from geopandas import gpd
+from osgeo import gdal
 from yirgacheffe.layers import RasterLayer, VectorLayer
 from alive_progress import alive_bar
 
-def load_crosswalk_table(table_file_name: str) -> Dict[str,int]:
+def load_crosswalk_table(table_file_name: str) -> Dict[str,List[int]]:
     rawdata = pd.read_csv(table_file_name)
-    result = {}
-    for _, row in rawdata.iterrows():
-        try:
-            result[row.code].append(int(row.value))
-        except KeyError:
-            result[row.code] = [int(row.value)]
-    return result
+    values = rawdata.value.astype(int)
+    return {code: group.tolist() for code, group in values.groupby(rawdata.code, sort=False)}
 
-def crosswalk_habitats(crosswalk_table: Dict[str, int], raw_habitats: List) -> List:
+def crosswalk_habitats(crosswalk_table: Dict[str,List[int]], raw_habitats: List) -> List:
     result = []
     for habitat in raw_habitats:
         try:
@@ -64,6 +60,10 @@ def aohcalc(
         print(f"No habitat for {species_id} {seasonality}")
         return
 
+    # Several IUCN codes often crosswalk to the same class, so dedupe and convert once up front rather
+    # than have np.isin rebuild an array from the list for every chunk
+    habitat_codes = np.unique(np.array(habitat_list))
+
     habitat_map = RasterLayer.layer_from_file(habitat_path)
     elevation_map = RasterLayer.layer_from_file(elevation_path)
     range_map = VectorLayer.layer_from_file_like(
@@ -81,6 +81,7 @@ def aohcalc(
     result = RasterLayer.empty_raster_layer_like(
         habitat_map,
         filename=result_filename,
+        datatype=gdal.GDT_Byte,
         compress=True,
         nodata=2,
         nbits=2
@@ -89,7 +90,7 @@ def aohcalc(
     # b.SetMetadataItem('NBITS', '2', 'IMAGE_STRUCTURE')
 
     try:
-        filtered_habtitat = habitat_map.numpy_apply(lambda chunk: np.isin(chunk, habitat_list))
+        filtered_habtitat = habitat_map.numpy_apply(lambda chunk: np.isin(chunk, habitat_codes))
     except ValueError:
         print(habitat_list)
         assert False
@@ -97,8 +98,9 @@ def aohcalc(
         lambda chunk: np.logical_and(chunk >= elevation_lower, chunk <= elevation_upper)
     )
 
-    calc = filtered_habtitat * filtered_elevation * range_map
-    calc = calc + (range_map.numpy_apply(lambda chunk: (1 - chunk)) * 2)
+    # Pixels outside the range get the nodata value of 2. Since the range is 0/1 this is the same as
+    # (aoh * range) + ((1 - range) * 2), but only rasterises the range polygon once per chunk.
+    calc = ((filtered_habtitat * filtered_elevation) - 2) * range_map + 2
     with alive_bar(manual=True) as bar:
         calc.save(result, callback=bar)
 
@@ -1,20 +1,17 @@
+import numpy as np
 import pandas as pd
 
 ELEVATION_MIN = -500
 ELEVATION_MAX = 9000
 
-def tidy_data(row: pd.Series) -> pd.Series:
+def tidy_data(df: pd.DataFrame) -> pd.DataFrame:
     """Tidy up the data as per Busana et als"""
 
-    if row.elevation_lower is None:
-        row.elevation_lower = ELEVATION_MIN
-    if row.elevation_upper is None:
-        row.elevation_upper = ELEVATION_MAX
-    if row.elevation_lower > row.elevation_upper:
-        low = row.elevation_lower
-        row.elevation_lower = row.elevation_upper
-        row.elevation_upper = low
-    row.elevation_lower = max(ELEVATION_MIN, row.elevation_lower)
-    row.elevation_upper = min(ELEVATION_MAX, row.elevation_upper)
+    lower = df.elevation_lower.fillna(ELEVATION_MIN).to_numpy(dtype=float)
+    upper = df.elevation_upper.fillna(ELEVATION_MAX).to_numpy(dtype=float)
 
-    return row
+    # Swap any inverted ranges, then clamp to the overall limits
+    return df.assign(
+        elevation_lower=np.maximum(np.minimum(lower, upper), ELEVATION_MIN),
+        elevation_upper=np.minimum(np.maximum(lower, upper), ELEVATION_MAX),
+    )
@@ -21,8 +21,8 @@ def extract_data_per_species(
         "full_habitat_code",
         "geometry"
     ]]
-    for _, raw in subset_of_interest.iterrows():
-        row = tidy_data(raw)
+    tidied_data = tidy_data(subset_of_interest)
+    for _, row in tidied_data.iterrows():
         output_path = os.path.join(output_directory_path, f"{row.id_no}_{row.seasonal}.geojson")
         res = gpd.GeoDataFrame(row.to_frame().transpose(), crs=species_data.crs, geometry="geometry")
         res.to_file(output_path, driver="GeoJSON")
@@ -99,12 +99,13 @@ def extract_data_per_species(
     engine = create_engine(DB_CONFIG, echo=False)
     dfi = gpd.read_postgis(text(STATEMENT), con=engine, geom_col="geometry", chunksize=1024)
     for df in dfi:
-        for _, raw in df.iterrows():
-            row = tidy_data(raw)
+        # Reproject the whole chunk in one go rather than building a new transform per species
+        df_projected = df.set_crs(src_crs, allow_override=True).to_crs(target_crs)
+        tidied_data = tidy_data(df_projected)
+        for _, row in tidied_data.iterrows():
             output_path = os.path.join(output_directory_path, f"{row.id_no}_{row.seasonal}.geojson")
-            res = gpd.GeoDataFrame(row.to_frame().transpose(), crs=src_crs, geometry="geometry")
-            res_projected = res.to_crs(target_crs)
-            res_projected.to_file(output_path, driver="GeoJSON")
+            res = gpd.GeoDataFrame(row.to_frame().transpose(), crs=target_crs, geometry="geometry")
+            res.to_file(output_path, driver="GeoJSON")
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Process agregate species data to per-species-file.")
@@ -1,19 +1,20 @@
 import pandas as pd
-import pytest
 
 from cleaning import tidy_data
 
-@pytest.mark.parametrize("input,expected",
-    [
-        ((0.0, 1.0), (0.0, 1.0)),
-        ((None, 1.0), (-500.0, 1.0)),
-        ((0.0, None), (0.0, 9000.0)),
-        ((1.0, 0.0), (0.0, 1.0)),
-        ((-1000.0, 1.0), (-500.0, 1.0)),
-        ((0.0, 10000.0), (0.0, 9000.0)),
-    ]
-)
-def test_elevation_tidy(input, expected):
-    row = pd.Series(input, ["elevation_lower", "elevation_upper"])
-    updated = tidy_data(row)
-    assert (updated.elevation_lower, updated.elevation_upper) == expected
+CASES = [
+    ((0.0, 1.0), (0.0, 1.0)),
+    ((None, 1.0), (-500.0, 1.0)),
+    ((0.0, None), (0.0, 9000.0)),
+    ((1.0, 0.0), (0.0, 1.0)),
+    ((-1000.0, 1.0), (-500.0, 1.0)),
+    ((0.0, 10000.0), (0.0, 9000.0)),
+]
+COLUMNS = ["elevation_lower", "elevation_upper"]
+
+INPUT = pd.DataFrame([case for case, _ in CASES], columns=COLUMNS)
+EXPECTED = pd.DataFrame([expected for _, expected in CASES], columns=COLUMNS)
+
+def test_elevation_tidy():
+    updated = tidy_data(INPUT)
+    pd.testing.assert_frame_equal(updated[COLUMNS], EXPECTED)